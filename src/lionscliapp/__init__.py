@@ -41,6 +41,7 @@ from lionscliapp.declarations import (
     describe_app,
     declare_projectdir,
     declare_cmd,
+    declare_cmds,
     describe_cmd,
     set_cmd_flag,
     declare_key,
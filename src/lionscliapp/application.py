@@ -377,13 +377,13 @@ def ensure_commands_bound():
     Raises:
         RuntimeError: If any command has fn=None.
     """
-    unbound = []
-    for cmd_name, cmd_schema in application["commands"].items():
-        if cmd_schema.get("fn") is None:
-            unbound.append(cmd_name)
+    unbound = [
+        cmd_name for cmd_name, cmd_schema in application["commands"].items()
+        if cmd_schema.get("fn") is None
+    ]
 
     if unbound:
-        cmd_list = ", ".join(repr(name) for name in sorted(unbound))
+        cmd_list = ", ".join(map(repr, sorted(unbound)))
         raise RuntimeError(
             f"Commands with unbound fn: {cmd_list}. "
             f"All commands must have fn bound before calling main()."
@@ -274,12 +274,12 @@ def _show_general_help():
 
     # User commands
     commands = app["commands"]
-    user_commands = {k: v for k, v in commands.items() if k != ""}
-    if user_commands:
+    user_command_names = [k for k in sorted(commands) if k != ""]
+    if user_command_names:
         print()
         print("Commands:")
-        for cmd_name, cmd_schema in sorted(user_commands.items()):
-            short = cmd_schema.get("short") or ""
+        for cmd_name in user_command_names:
+            short = commands[cmd_name].get("short") or ""
             if short:
                 print(f"  {cmd_name:24} {short}")
             else:
@@ -16,10 +16,24 @@ This module owns argv processing in two phases:
 All values are stored as raw strings. Coercion happens later in ctx building.
 """
 
+import sys
+
 from lionscliapp import cli_state
 from lionscliapp import override_inputs
 
 
+# Framework options: full "--name" token -> cli_state.g key it sets.
+# Any other --option is a config override and goes to cli_overrides.
+CLI_STATE_OPTIONS = {
+    "--execroot": "execroot_override",
+    "--options-file": "options_file",
+    "--project-dir": "project_dir_override",
+}
+
+# Sentinel for "argv ran out before an option's value".
+_MISSING = object()
+
+
 def ingest_argv(argv: list[str]) -> None:
     """
     Parse command-line arguments into cli_state and override_inputs.
@@ -37,49 +51,34 @@ def ingest_argv(argv: list[str]) -> None:
     cli_state.reset_cli_state()
     override_inputs.cli_overrides.clear()
 
-    i = 0
-    while i < len(argv):
-        token = argv[i]
+    g = cli_state.g
+    overrides = override_inputs.cli_overrides
+    positional_args = cli_state.positional_args
 
-        if token.startswith("--"):
-            i = _handle_option(argv, i)
-        elif token.startswith("-"):
-            raise ValueError(f"Short options not supported: '{token}'")
-        else:
-            cli_state.positional_args.append(token)
-            i += 1
-
-
-def _handle_option(argv: list[str], i: int) -> int:
-    """
-    Handle a --option value pair starting at index i.
+    tokens = iter(argv)
+    for token in tokens:
+        # Classify by leading characters; slicing also handles "" safely.
+        if token[:1] != "-":
+            positional_args.append(token)
+            continue
 
-    Returns the next index to process.
-
-    Raises:
-        ValueError: If option name is empty or value is missing.
-    """
-    token = argv[i]
-    key = token[2:]
-
-    if not key:
-        raise ValueError("Empty option name: '--' is not valid")
-
-    if i + 1 >= len(argv):
-        raise ValueError(f"Option '{token}' requires a value")
+        if token[1:2] != "-":
+            raise ValueError(f"Short options not supported: '{token}'")
 
-    value = argv[i + 1]
+        if len(token) == 2:
+            raise ValueError("Empty option name: '--' is not valid")
 
-    if key == "execroot":
-        cli_state.g["execroot_override"] = value
-    elif key == "options-file":
-        cli_state.g["options_file"] = value
-    elif key == "project-dir":
-        cli_state.g["project_dir_override"] = value
-    else:
-        override_inputs.cli_overrides[key] = value
+        value = next(tokens, _MISSING)
+        if value is _MISSING:
+            raise ValueError(f"Option '{token}' requires a value")
 
-    return i + 2
+        state_key = CLI_STATE_OPTIONS.get(token)
+        if state_key is not None:
+            g[state_key] = value
+        else:
+            # Interned so later lookups against option keys can
+            # short-circuit on identity.
+            overrides[sys.intern(token[2:])] = value
 
 
 def interpret_arguments() -> None:
@@ -108,7 +107,8 @@ def interpret_arguments() -> None:
         cli_state.g["command"] = ""
         return
 
-    command = args[0]
+    # Interned to match the interned command names from declarations.
+    command = sys.intern(args[0])
     cli_state.g["command"] = command
 
     if command == "set":
@@ -19,7 +19,8 @@ Note: Option overrides (--key value) are written directly to
 override_inputs.cli_overrides by cli_parsing.
 """
 
-g = {
+# Initial value of every key in g. reset_cli_state() restores g from this.
+_G_INITIAL = {
     # Set by ingest_argv
     "options_file": None,           # None | str (path)
     "execroot_override": None,      # None | str (path)
@@ -32,6 +33,8 @@ g = {
     "command_help": None,           # None | str (for help command)
 }
 
+g = dict(_G_INITIAL)
+
 positional_args = []
 
 
@@ -39,14 +42,8 @@ def reset_cli_state():
     """
     Reset all CLI state to initial values.
 
-    Clears g to None values and empties positional_args.
+    Restores g from _G_INITIAL in place and empties positional_args.
     Called at the start of ingest_argv() and by app.reset().
     """
-    g["options_file"] = None
-    g["execroot_override"] = None
-    g["project_dir_override"] = None
-    g["command"] = None
-    g["key"] = None
-    g["value"] = None
-    g["command_help"] = None
+    g.update(_G_INITIAL)
     del positional_args[:]
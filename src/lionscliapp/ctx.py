@@ -44,32 +44,38 @@ def build_ctx():
 
     After merging, values are coerced by namespace prefix.
 
-    Modifies the global ctx dict in place.
+    Modifies the global ctx dict in place. All layers are merged and coerced
+    before ctx is touched, so a coercion error leaves the previous ctx intact.
     """
-    ctx.clear()
+    merged = {}
 
     # Layer 1: Defaults
     for key, opt_schema in application["options"].items():
-        ctx[key] = opt_schema["default"]
+        merged[key] = opt_schema["default"]
 
     # Layer 2: Config file
     for key, value in config_io.raw_config.get("options", {}).items():
-        if key in ctx:
-            ctx[key] = value
+        if key in merged:
+            merged[key] = value
 
     # Layer 3: Options file overrides
     for key, value in override_inputs.options_file_overrides.items():
-        if key in ctx:
-            ctx[key] = value
+        if key in merged:
+            merged[key] = value
 
     # Layer 4: CLI overrides
     for key, value in override_inputs.cli_overrides.items():
-        if key in ctx:
-            ctx[key] = value
+        if key in merged:
+            merged[key] = value
+
+    # Coerce values by namespace; keys without a coercion rule are left as-is
+    for key, value in merged.items():
+        coerce = _resolve_coercer(key)
+        if coerce is not None:
+            merged[key] = coerce(key, value)
 
-    # Coerce all values by namespace
-    for key in ctx:
-        ctx[key] = _coerce_value(key, ctx[key])
+    ctx.clear()
+    ctx.update(merged)
 
 
 def _coerce_value(key, value):
@@ -86,17 +92,25 @@ def _coerce_value(key, value):
     Raises:
         ValueError: If the value cannot be coerced to the expected type.
     """
-    namespace = _get_namespace(key)
-
-    if namespace in ("path", "execpath"):
-        return _coerce_path(key, value)
-    elif namespace == "projpath":
-        return _coerce_projpath(key, value)
-    elif namespace == "json.indent":
-        return _coerce_json_indent(key, value)
-    else:
+    coerce = _resolve_coercer(key)
+    if coerce is None:
         # Unknown namespace: identity (no coercion)
         return value
+    return coerce(key, value)
+
+
+def _resolve_coercer(key):
+    """
+    Return the coercion function for a key's namespace.
+
+    Args:
+        key: The dot-namespaced option key
+
+    Returns:
+        A function (key, value) -> coerced value, or None if the key's
+        namespace has no coercion rule.
+    """
+    return _NAMESPACE_COERCERS.get(_get_namespace(key))
 
 
 def _get_namespace(key):
@@ -115,10 +129,8 @@ def _get_namespace(key):
     if key.startswith("json.indent."):
         return "json.indent"
 
-    # Single-level namespace: prefix before first dot
-    if "." in key:
-        return key.split(".", 1)[0]
-    return key
+    # Single-level namespace: prefix before first dot (whole key if none)
+    return key.partition(".")[0]
 
 
 def _coerce_path(key, value):
@@ -218,6 +230,15 @@ def _coerce_json_indent(key, value):
     return int_value
 
 
+# Coercion function per namespace; namespaces not listed pass through as-is.
+_NAMESPACE_COERCERS = {
+    "path": _coerce_path,
+    "execpath": _coerce_path,
+    "projpath": _coerce_projpath,
+    "json.indent": _coerce_json_indent,
+}
+
+
 def reset_ctx():
     """
     Reset ctx to an empty state.
@@ -15,6 +15,7 @@ Usage:
     app.declare_key("execpath.output", "/tmp/out")
 """
 
+import sys
 import warnings
 
 from lionscliapp.runtime_state import require_declaring_phase
@@ -79,16 +80,31 @@ def declare_cmd(name, fn):
         fn: Callable to execute when command is invoked
     """
     require_declaring_phase()
+    name = _intern(name)
     if name not in application["commands"]:
-        application["commands"][name] = {
-            "fn": None,
-            "short": None,
-            "long": None,
-            "flags": DEFAULT_COMMAND_FLAGS.copy()
-        }
+        application["commands"][name] = _new_command_entry()
     application["commands"][name]["fn"] = fn
 
 
+def declare_cmds(cmds):
+    """
+    Bind several commands at once.
+
+    Equivalent to calling declare_cmd(name, fn) for each item, but checks
+    the phase once for the whole batch.
+
+    Args:
+        cmds: Mapping of command name -> callable
+    """
+    require_declaring_phase()
+    commands = application["commands"]
+    for name, fn in cmds.items():
+        name = _intern(name)
+        if name not in commands:
+            commands[name] = _new_command_entry()
+        commands[name]["fn"] = fn
+
+
 def describe_cmd(name, description, flags=""):
     """
     Declare a short or long description for a command.
@@ -101,13 +117,9 @@ def describe_cmd(name, description, flags=""):
         flags: "" or "s" for short (default), "l" for long
     """
     require_declaring_phase()
+    name = _intern(name)
     if name not in application["commands"]:
-        application["commands"][name] = {
-            "fn": None,
-            "short": None,
-            "long": None,
-            "flags": DEFAULT_COMMAND_FLAGS.copy()
-        }
+        application["commands"][name] = _new_command_entry()
     if "l" in flags:
         application["commands"][name]["long"] = description
     else:
@@ -127,6 +139,7 @@ def set_cmd_flag(name, flag_name, value):
         value: Boolean value to assign
     """
     require_declaring_phase()
+    name = _intern(name)
     if not isinstance(value, bool):
         raise ValueError(
             f"set_cmd_flag: value for '{flag_name}' on command {name!r} "
@@ -134,12 +147,7 @@ def set_cmd_flag(name, flag_name, value):
         )
 
     if name not in application["commands"]:
-        application["commands"][name] = {
-            "fn": None,
-            "short": None,
-            "long": None,
-            "flags": DEFAULT_COMMAND_FLAGS.copy()
-        }
+        application["commands"][name] = _new_command_entry()
 
     if "flags" not in application["commands"][name]:
         application["commands"][name]["flags"] = DEFAULT_COMMAND_FLAGS.copy()
@@ -159,6 +167,7 @@ def declare_key(key, default):
         default: Default value (JSON-serializable)
     """
     require_declaring_phase()
+    key = _intern(key)
     if key.startswith("path."):
         unprefixed = key[5:]
         warnings.warn(
@@ -189,6 +198,7 @@ def describe_key(key, description, flags=""):
         flags: "" or "s" for short (default), "l" for long
     """
     require_declaring_phase()
+    key = _intern(key)
     if key not in application["options"]:
         application["options"][key] = {
             "default": None,
@@ -237,6 +247,29 @@ def declare(spec):
     _deep_merge(application, spec)
 
 
+def _new_command_entry():
+    """Return a new command entry with all required keys at their defaults."""
+    return {
+        "fn": None,
+        "short": None,
+        "long": None,
+        "flags": DEFAULT_COMMAND_FLAGS.copy()
+    }
+
+
+def _intern(name):
+    """
+    Intern a command name or option key.
+
+    Interned names hash once and let later lookups by the same name (from
+    argv or ctx) match by identity. Non-str values are returned unchanged
+    so that validate_application() can report them.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    return name
+
+
 def _deep_merge(target, source):
     """
     Recursively merge source into target.
@@ -86,30 +86,36 @@ def _no_command_fallback():
     short_desc = app_id["short_desc"]
     long_desc = app_id["long_desc"]
 
+    # Assemble all lines and print them in one call
+    lines = []
+    append = lines.append
+
     # Header
     if short_desc:
-        print(f"{name} v{version} - {short_desc}")
+        append(f"{name} v{version} - {short_desc}")
     else:
-        print(f"{name} v{version}")
+        append(f"{name} v{version}")
 
     # Long description
     if long_desc:
-        print()
-        print(long_desc)
+        append("")
+        append(long_desc)
 
     # Commands
     commands = app["commands"]
     if commands:
-        print()
-        print("Commands:")
-        for cmd_name, cmd_schema in sorted(commands.items()):
+        append("")
+        append("Commands:")
+        for cmd_name in sorted(commands):
             if cmd_name == "":
                 continue  # Don't list the no-command handler
-            short = cmd_schema.get("short") or ""
+            short = commands[cmd_name].get("short") or ""
             if short:
-                print(f"  {cmd_name:20} {short}")
+                append("  " + cmd_name.ljust(20) + " " + short)
             else:
-                print(f"  {cmd_name}")
+                append("  " + cmd_name)
     else:
-        print()
-        print("No commands available.")
+        append("")
+        append("No commands available.")
+
+    print("\n".join(lines))
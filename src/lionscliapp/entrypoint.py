@@ -98,7 +98,9 @@ def _startup():
     Execute all startup steps before command dispatch.
 
     Validates application, parses CLI, resolves execroot, loads config,
-    and builds ctx.
+    and builds ctx. When the invocation has no options and will only show
+    the no-command fallback help, stops after parsing and the transition
+    to running.
 
     Raises:
         StartupError: If any startup step fails.
@@ -121,6 +123,12 @@ def _startup():
         # Transition to running
         runtime_state.transition_to_running()
 
+        # Bare invocation without a "" command or any option only shows the
+        # fallback help, which reads nothing from disk or ctx: skip the
+        # filesystem steps.
+        if _is_fallback_help():
+            return
+
         # Resolve execution root
         resolve_execroot.resolve_execroot()
 
@@ -140,6 +148,24 @@ def _startup():
         raise StartupError(str(e)) from e
 
 
+def _is_fallback_help():
+    """
+    Return True if startup can stop before the filesystem steps.
+
+    That is the case when no command was given, no "" command is declared,
+    and no framework option or override was passed: those still have to be
+    checked (and fail) as in a full startup.
+    """
+    g = cli_state.g
+    return (
+        g["command"] == ""
+        and "" not in appmodel.application["commands"]
+        and g["execroot_override"] is None
+        and g["options_file"] is None
+        and not override_inputs.cli_overrides
+    )
+
+
 def _apply_project_dir_override_if_requested():
     """
     Apply --project-dir override to application["names"]["project_dir"] in place.
@@ -66,6 +66,11 @@ def _search_upwards_for_project_dir(start, project_dir):
     Returns:
         Path: Directory containing the project directory, or None if not found
     """
+    # Common case: the project directory is right here. One stat, and no
+    # resolve() of the start path.
+    if (start / project_dir).is_dir():
+        return start
+
     current = start.resolve()
 
     while True:
@@ -1,6 +1,5 @@
 """Tests for lionscliapp.ctx module."""
 
-import os
 from pathlib import Path
 
 import pytest
@@ -20,32 +19,68 @@ def setup_function():
     app.reset()
 
 
+@pytest.fixture(scope="module")
+def shared_project(tmp_path_factory):
+    """
+    Return an execroot shared by every test in this module.
+
+    It holds an empty .myproject/ and no config.json. Tests that write
+    config or options files use their own tmp_path instead.
+    """
+    root = tmp_path_factory.mktemp("proj")
+    (root / ".myproject").mkdir()
+    return root
+
+
+@pytest.fixture
+def in_project(shared_project, monkeypatch):
+    """
+    Run the startup steps up to build_ctx() in shared_project.
+
+    Tests declare their options afterwards and call build_ctx() themselves.
+    Returns the execroot.
+    """
+    monkeypatch.chdir(shared_project)
+    application["names"]["project_dir"] = ".myproject"
+    resolve_execroot()
+    load_config()
+    load_options_file()
+    return shared_project
+
+
+@pytest.fixture
+def built_ctx(in_project):
+    """
+    Return a helper that declares options and builds ctx in shared_project.
+
+    The helper takes {key: default}, declares each key, runs build_ctx(),
+    and returns ctx.
+    """
+    def _build(defaults):
+        for key, default in defaults.items():
+            application["options"][key] = {"default": default, "short": None, "long": None}
+        build_ctx()
+        return ctx
+
+    return _build
+
+
 # =============================================================================
 # Layer merging tests
 # =============================================================================
 
-def test_build_ctx_defaults_only(tmp_path):
+def test_build_ctx_defaults_only(in_project):
     """build_ctx() uses declared defaults when no config or CLI overrides."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["db.host"] = {"default": "localhost", "short": None, "long": None}
     application["options"]["db.port"] = {"default": 5432, "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-
-        load_options_file()
-        build_ctx()
+    build_ctx()
 
-        assert ctx["db.host"] == "localhost"
-        assert ctx["db.port"] == 5432
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["db.host"] == "localhost"
+    assert ctx["db.port"] == 5432
 
 
-def test_build_ctx_config_overrides_defaults(tmp_path):
+def test_build_ctx_config_overrides_defaults(tmp_path, monkeypatch):
     """build_ctx() uses config values over defaults."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["db.host"] = {"default": "localhost", "short": None, "long": None}
@@ -56,21 +91,17 @@ def test_build_ctx_config_overrides_defaults(tmp_path):
     config_path = project_dir / "config.json"
     config_path.write_text('{"options": {"db.host": "remotehost"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-        build_ctx()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
+    load_options_file()
+    build_ctx()
 
-        assert ctx["db.host"] == "remotehost"  # from config
-        assert ctx["db.port"] == 5432  # from default
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["db.host"] == "remotehost"  # from config
+    assert ctx["db.port"] == 5432  # from default
 
 
-def test_build_ctx_cli_overrides_config(tmp_path):
+def test_build_ctx_cli_overrides_config(tmp_path, monkeypatch):
     """build_ctx() uses CLI overrides over config values."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["db.host"] = {"default": "localhost", "short": None, "long": None}
@@ -80,43 +111,29 @@ def test_build_ctx_cli_overrides_config(tmp_path):
     config_path = project_dir / "config.json"
     config_path.write_text('{"options": {"db.host": "confighost"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
+    load_options_file()
 
-        cli_overrides["db.host"] = "clihost"
-        build_ctx()
+    cli_overrides["db.host"] = "clihost"
+    build_ctx()
 
-        assert ctx["db.host"] == "clihost"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["db.host"] == "clihost"
 
 
-def test_build_ctx_cli_overrides_defaults(tmp_path):
+def test_build_ctx_cli_overrides_defaults(in_project):
     """build_ctx() uses CLI overrides over defaults (no config)."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["db.host"] = {"default": "localhost", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        cli_overrides["db.host"] = "clihost"
+    cli_overrides["db.host"] = "clihost"
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["db.host"] == "clihost"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["db.host"] == "clihost"
 
 
-def test_build_ctx_full_layering(tmp_path):
+def test_build_ctx_full_layering(tmp_path, monkeypatch):
     """build_ctx() correctly layers defaults < config < CLI."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["a"] = {"default": "default_a", "short": None, "long": None}
@@ -128,25 +145,21 @@ def test_build_ctx_full_layering(tmp_path):
     config_path = project_dir / "config.json"
     config_path.write_text('{"options": {"b": "config_b", "c": "config_c"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
+    load_options_file()
 
-        cli_overrides["c"] = "cli_c"
+    cli_overrides["c"] = "cli_c"
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["a"] == "default_a"  # only default
-        assert ctx["b"] == "config_b"   # config overrode default
-        assert ctx["c"] == "cli_c"      # CLI overrode config
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["a"] == "default_a"  # only default
+    assert ctx["b"] == "config_b"   # config overrode default
+    assert ctx["c"] == "cli_c"      # CLI overrode config
 
 
-def test_build_ctx_ignores_undeclared_keys_in_config(tmp_path):
+def test_build_ctx_ignores_undeclared_keys_in_config(tmp_path, monkeypatch):
     """build_ctx() ignores config keys not declared in application.options."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["declared"] = {"default": "default_value", "short": None, "long": None}
@@ -156,541 +169,168 @@ def test_build_ctx_ignores_undeclared_keys_in_config(tmp_path):
     config_path = project_dir / "config.json"
     config_path.write_text('{"options": {"declared": "config_value", "undeclared": "ignored"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["declared"] == "config_value"
-        assert "undeclared" not in ctx
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["declared"] == "config_value"
+    assert "undeclared" not in ctx
 
 
-def test_build_ctx_ignores_undeclared_keys_in_cli(tmp_path):
+def test_build_ctx_ignores_undeclared_keys_in_cli(in_project):
     """build_ctx() ignores CLI override keys not declared in application.options."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["declared"] = {"default": "default_value", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        cli_overrides["declared"] = "cli_value"
-        cli_overrides["undeclared"] = "ignored"
+    cli_overrides["declared"] = "cli_value"
+    cli_overrides["undeclared"] = "ignored"
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["declared"] == "cli_value"
-        assert "undeclared" not in ctx
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["declared"] == "cli_value"
+    assert "undeclared" not in ctx
 
 
 # =============================================================================
-# Path namespace coercion tests
+# Path namespace coercion tests (path.*, execpath.*, projpath.*)
 # =============================================================================
 
-def test_coerce_path_absolute(tmp_path):
-    """path.* keys are coerced to pathlib.Path (absolute paths unchanged)."""
-    application["names"]["project_dir"] = ".myproject"
-    # Use tmp_path to construct a truly absolute path that works cross-platform
-    absolute_path = str(tmp_path / "absolute" / "path")
-    application["options"]["path.output"] = {"default": absolute_path, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+# path.* is the deprecated spelling of execpath.*; both resolve against execroot.
+EXECROOT_PATH_KEYS = ["path.output", "execpath.output"]
+ALL_PATH_KEYS = EXECROOT_PATH_KEYS + ["projpath.output"]
 
-        build_ctx()
-
-        assert isinstance(ctx["path.output"], Path)
-        assert ctx["path.output"] == Path(absolute_path)
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_path_relative_resolved_against_execroot(tmp_path):
-    """path.* relative paths are resolved against execroot, not CWD."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["path.output"] = {"default": "relative/path", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+@pytest.mark.parametrize("key", ALL_PATH_KEYS)
+def test_coerce_path_absolute_unchanged(built_ctx, in_project, key):
+    """Path keys are coerced to pathlib.Path; absolute paths are left as-is."""
+    # Use the execroot to construct a truly absolute path that works cross-platform
+    absolute_path = str(in_project / "absolute" / "path")
 
-        build_ctx()
+    result = built_ctx({key: absolute_path})
 
-        assert isinstance(ctx["path.output"], Path)
-        assert ctx["path.output"] == tmp_path / "relative" / "path"
-    finally:
-        os.chdir(original_cwd)
+    assert isinstance(result[key], Path)
+    assert result[key] == Path(absolute_path)
 
 
-def test_coerce_path_expanduser(tmp_path):
-    """path.* keys expand ~ to user home directory."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["path.config"] = {"default": "~/myconfig", "short": None, "long": None}
+@pytest.mark.parametrize("key", EXECROOT_PATH_KEYS)
+def test_coerce_path_relative_resolved_against_execroot(built_ctx, in_project, key):
+    """path.* and execpath.* relative paths are resolved against execroot, not CWD."""
+    result = built_ctx({key: "relative/path"})
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    assert isinstance(result[key], Path)
+    assert result[key] == in_project / "relative" / "path"
 
-        build_ctx()
 
-        assert isinstance(ctx["path.config"], Path)
-        # After expanduser, should not contain ~
-        assert "~" not in str(ctx["path.config"])
-        # Should be absolute (expanduser makes it absolute)
-        assert ctx["path.config"].is_absolute()
-    finally:
-        os.chdir(original_cwd)
+@pytest.mark.parametrize("key", ALL_PATH_KEYS)
+def test_coerce_path_expanduser(built_ctx, key):
+    """Path keys expand ~ to user home directory."""
+    result = built_ctx({key: "~/myconfig"})
 
+    assert isinstance(result[key], Path)
+    # After expanduser, should not contain ~
+    assert "~" not in str(result[key])
+    # Should be absolute (expanduser makes it absolute)
+    assert result[key].is_absolute()
 
-def test_coerce_path_non_string_raises(tmp_path):
-    """path.* raises ValueError if value is not a string."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["path.output"] = {"default": 123, "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+@pytest.mark.parametrize("key", ALL_PATH_KEYS)
+def test_coerce_path_non_string_raises(built_ctx, key):
+    """Path keys raise ValueError if value is not a string."""
+    with pytest.raises(ValueError, match="path value must be a string"):
+        built_ctx({key: 123})
 
-        with pytest.raises(ValueError, match="path value must be a string"):
-            build_ctx()
-    finally:
-        os.chdir(original_cwd)
 
+@pytest.mark.parametrize("key", ALL_PATH_KEYS)
+def test_coerce_path_none_allows_none(built_ctx, key):
+    """Path keys allow None and keep it as None."""
+    result = built_ctx({key: None})
 
-def test_coerce_path_none_allows_none(tmp_path):
-    """path.* allows None and keeps it as None."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["path.output"] = {"default": None, "short": None, "long": None}
+    assert result[key] is None
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
 
-        build_ctx()
-
-        assert ctx["path.output"] is None
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_path_deep_namespace(tmp_path):
+def test_coerce_path_deep_namespace(in_project):
     """path.* coercion works for deeply nested keys like path.output.inventory."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["path.output.inventory"] = {"default": "output/inv.json", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
+    build_ctx()
 
-        assert isinstance(ctx["path.output.inventory"], Path)
-        assert ctx["path.output.inventory"] == tmp_path / "output" / "inv.json"
-    finally:
-        os.chdir(original_cwd)
-
-
-# =============================================================================
-# execpath namespace coercion tests
-# =============================================================================
-
-def test_coerce_execpath_absolute(tmp_path):
-    """execpath.* keys are coerced to pathlib.Path (absolute paths unchanged)."""
-    application["names"]["project_dir"] = ".myproject"
-    absolute_path = str(tmp_path / "absolute" / "path")
-    application["options"]["execpath.output"] = {"default": absolute_path, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert isinstance(ctx["execpath.output"], Path)
-        assert ctx["execpath.output"] == Path(absolute_path)
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_execpath_relative_resolved_against_execroot(tmp_path):
-    """execpath.* relative paths are resolved against execroot, not CWD."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["execpath.output"] = {"default": "relative/path", "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert isinstance(ctx["execpath.output"], Path)
-        assert ctx["execpath.output"] == tmp_path / "relative" / "path"
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_execpath_expanduser(tmp_path):
-    """execpath.* keys expand ~ to user home directory."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["execpath.config"] = {"default": "~/myconfig", "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert isinstance(ctx["execpath.config"], Path)
-        assert "~" not in str(ctx["execpath.config"])
-        assert ctx["execpath.config"].is_absolute()
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_execpath_none_allows_none(tmp_path):
-    """execpath.* allows None and keeps it as None."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["execpath.output"] = {"default": None, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert ctx["execpath.output"] is None
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_execpath_non_string_raises(tmp_path):
-    """execpath.* raises ValueError if value is not a string."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["execpath.output"] = {"default": 123, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        with pytest.raises(ValueError, match="path value must be a string"):
-            build_ctx()
-    finally:
-        os.chdir(original_cwd)
+    assert isinstance(ctx["path.output.inventory"], Path)
+    assert ctx["path.output.inventory"] == in_project / "output" / "inv.json"
 
 
 # =============================================================================
 # projpath namespace coercion tests
 # =============================================================================
 
-def test_coerce_projpath_relative_resolved_against_project_root(tmp_path):
+def test_coerce_projpath_relative_resolved_against_project_root(in_project):
     """projpath.* relative paths are resolved against project root, not execroot."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["projpath.cache"] = {"default": "cache/", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert isinstance(ctx["projpath.cache"], Path)
-        assert ctx["projpath.cache"] == tmp_path / ".myproject" / "cache"
-    finally:
-        os.chdir(original_cwd)
+    build_ctx()
 
+    assert isinstance(ctx["projpath.cache"], Path)
+    assert ctx["projpath.cache"] == in_project / ".myproject" / "cache"
 
-def test_coerce_projpath_absolute_unchanged(tmp_path):
-    """projpath.* absolute paths are left as-is."""
-    application["names"]["project_dir"] = ".myproject"
-    absolute_path = str(tmp_path / "somewhere" / "else")
-    application["options"]["projpath.cache"] = {"default": absolute_path, "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert isinstance(ctx["projpath.cache"], Path)
-        assert ctx["projpath.cache"] == Path(absolute_path)
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_projpath_expanduser(tmp_path):
-    """projpath.* keys expand ~ to user home directory."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["projpath.logs"] = {"default": "~/mylogs", "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert isinstance(ctx["projpath.logs"], Path)
-        assert "~" not in str(ctx["projpath.logs"])
-        assert ctx["projpath.logs"].is_absolute()
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_projpath_none_allows_none(tmp_path):
-    """projpath.* allows None and keeps it as None."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["projpath.cache"] = {"default": None, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert ctx["projpath.cache"] is None
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_projpath_non_string_raises(tmp_path):
-    """projpath.* raises ValueError if value is not a string."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["projpath.cache"] = {"default": 99, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        with pytest.raises(ValueError, match="path value must be a string"):
-            build_ctx()
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_projpath_differs_from_execpath(tmp_path):
+def test_projpath_differs_from_execpath(in_project):
     """projpath.* and execpath.* resolve to different roots for relative paths."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["execpath.data"] = {"default": "data/", "short": None, "long": None}
     application["options"]["projpath.data"] = {"default": "data/", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
+    build_ctx()
 
-        assert ctx["execpath.data"] == tmp_path / "data"
-        assert ctx["projpath.data"] == tmp_path / ".myproject" / "data"
-        assert ctx["execpath.data"] != ctx["projpath.data"]
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["execpath.data"] == in_project / "data"
+    assert ctx["projpath.data"] == in_project / ".myproject" / "data"
+    assert ctx["execpath.data"] != ctx["projpath.data"]
 
 
 # =============================================================================
 # json.indent namespace coercion tests
 # =============================================================================
 
-def test_coerce_json_indent_integer(tmp_path):
-    """json.indent.* coerces to int."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["json.indent.output"] = {"default": 4, "short": None, "long": None}
+@pytest.mark.parametrize("default, expected", [(4, 4), ("2", 2), (0, 0)])
+def test_coerce_json_indent_valid(built_ctx, default, expected):
+    """json.indent.* coerces ints and numeric strings to int; zero allowed."""
+    result = built_ctx({"json.indent.output": default})
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    assert result["json.indent.output"] == expected
+    assert isinstance(result["json.indent.output"], int)
 
-        build_ctx()
 
-        assert ctx["json.indent.output"] == 4
-        assert isinstance(ctx["json.indent.output"], int)
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_json_indent_string_to_int(tmp_path):
-    """json.indent.* coerces string to int."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["json.indent.output"] = {"default": "2", "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert ctx["json.indent.output"] == 2
-        assert isinstance(ctx["json.indent.output"], int)
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_json_indent_zero_allowed(tmp_path):
-    """json.indent.* allows zero."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["json.indent.output"] = {"default": 0, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
-
-        assert ctx["json.indent.output"] == 0
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_json_indent_negative_raises(tmp_path):
-    """json.indent.* raises ValueError for negative values."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["json.indent.output"] = {"default": -1, "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        with pytest.raises(ValueError, match="must be >= 0"):
-            build_ctx()
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_coerce_json_indent_non_numeric_raises(tmp_path):
-    """json.indent.* raises ValueError for non-numeric values."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["json.indent.output"] = {"default": "abc", "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        with pytest.raises(ValueError, match="must be an integer"):
-            build_ctx()
-    finally:
-        os.chdir(original_cwd)
+@pytest.mark.parametrize("default, message", [
+    (-1, "must be >= 0"),
+    ("abc", "must be an integer"),
+])
+def test_coerce_json_indent_invalid_raises(built_ctx, default, message):
+    """json.indent.* raises ValueError for negative or non-numeric values."""
+    with pytest.raises(ValueError, match=message):
+        built_ctx({"json.indent.output": default})
 
 
 # =============================================================================
 # Unknown namespace tests
 # =============================================================================
 
-def test_coerce_unknown_namespace_identity(tmp_path):
+def test_coerce_unknown_namespace_identity(built_ctx):
     """Unknown namespace keys pass through without coercion."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["custom.setting"] = {"default": "value", "short": None, "long": None}
-    application["options"]["custom.number"] = {"default": 42, "short": None, "long": None}
-    application["options"]["custom.list"] = {"default": [1, 2, 3], "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    result = built_ctx({
+        "custom.setting": "value",
+        "custom.number": 42,
+        "custom.list": [1, 2, 3],
+    })
 
-        build_ctx()
-
-        assert ctx["custom.setting"] == "value"
-        assert ctx["custom.number"] == 42
-        assert ctx["custom.list"] == [1, 2, 3]
-    finally:
-        os.chdir(original_cwd)
+    assert result["custom.setting"] == "value"
+    assert result["custom.number"] == 42
+    assert result["custom.list"] == [1, 2, 3]
 
 
-def test_coerce_no_namespace_key_identity(tmp_path):
+def test_coerce_no_namespace_key_identity(built_ctx):
     """Keys without dots pass through without coercion."""
-    application["names"]["project_dir"] = ".myproject"
-    application["options"]["simple"] = {"default": "value", "short": None, "long": None}
-
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    result = built_ctx({"simple": "value"})
 
-        build_ctx()
-
-        assert ctx["simple"] == "value"
-    finally:
-        os.chdir(original_cwd)
+    assert result["simple"] == "value"
 
 
 # =============================================================================
@@ -707,54 +347,62 @@ def test_reset_ctx_clears_ctx():
     assert ctx == {}
 
 
-def test_build_ctx_clears_previous_ctx(tmp_path):
-    """build_ctx() clears any previous ctx contents."""
-    application["names"]["project_dir"] = ".myproject"
+def test_build_ctx_clears_previous_ctx(in_project):
+    """build_ctx() removes ctx keys that are not declared options."""
     application["options"]["new.key"] = {"default": "new_value", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
+    ctx["stale.key"] = "stale_value"
+
+    build_ctx()
+
+    assert "stale.key" not in ctx
+    assert ctx["new.key"] == "new_value"
+
+
+def test_build_ctx_rebuild_picks_up_changed_values(in_project):
+    """A rebuild replaces values that changed, including nested and bool/int changes."""
+    application["options"]["x"] = {"default": 1, "short": None, "long": None}
+    application["options"]["custom.list"] = {"default": [1], "short": None, "long": None}
+    build_ctx()
 
-        ctx["stale.key"] = "stale_value"
+    application["options"]["x"]["default"] = True
+    application["options"]["custom.list"]["default"] = [1.0]
+    build_ctx()
 
+    assert ctx["x"] is True
+    assert type(ctx["custom.list"][0]) is float
+
+
+def test_build_ctx_error_leaves_previous_ctx(in_project):
+    """A coercion error during rebuild leaves the previous ctx untouched."""
+    application["options"]["custom.key"] = {"default": "value", "short": None, "long": None}
+    application["options"]["json.indent.output"] = {"default": 2, "short": None, "long": None}
+    build_ctx()
+
+    application["options"]["json.indent.output"]["default"] = -1
+
+    with pytest.raises(ValueError, match="must be >= 0"):
         build_ctx()
 
-        assert "stale.key" not in ctx
-        assert ctx["new.key"] == "new_value"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx == {"custom.key": "value", "json.indent.output": 2}
 
 
-def test_ctx_is_same_object_after_build(tmp_path):
+def test_ctx_is_same_object_after_build(in_project):
     """build_ctx() modifies ctx in place, not replacing it."""
-    application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "value", "short": None, "long": None}
 
     original_ctx_id = id(ctx)
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
-        load_options_file()
-
-        build_ctx()
+    build_ctx()
 
-        assert id(ctx) == original_ctx_id
-    finally:
-        os.chdir(original_cwd)
+    assert id(ctx) == original_ctx_id
 
 
 # =============================================================================
 # Options file tests
 # =============================================================================
 
-def test_options_file_overrides_config(tmp_path):
+def test_options_file_overrides_config(tmp_path, monkeypatch):
     """Options file values override config file values."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["db.host"] = {"default": "localhost", "short": None, "long": None}
@@ -769,23 +417,19 @@ def test_options_file_overrides_config(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('{"options": {"db.host": "optshost"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
-        load_options_file()
+    cli_state.g["options_file"] = str(options_file)
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["db.host"] == "optshost"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["db.host"] == "optshost"
 
 
-def test_options_file_overridden_by_cli(tmp_path):
+def test_options_file_overridden_by_cli(tmp_path, monkeypatch):
     """CLI overrides take precedence over options file."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["db.host"] = {"default": "localhost", "short": None, "long": None}
@@ -794,24 +438,20 @@ def test_options_file_overridden_by_cli(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('{"options": {"db.host": "optshost"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
-        cli_overrides["db.host"] = "clihost"
-        load_options_file()
+    cli_state.g["options_file"] = str(options_file)
+    cli_overrides["db.host"] = "clihost"
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["db.host"] == "clihost"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["db.host"] == "clihost"
 
 
-def test_options_file_full_layering(tmp_path):
+def test_options_file_full_layering(tmp_path, monkeypatch):
     """Full layering: defaults < config < options_file < CLI."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["a"] = {"default": "default_a", "short": None, "long": None}
@@ -829,27 +469,23 @@ def test_options_file_full_layering(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('{"options": {"c": "opts_c", "d": "opts_d"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
-        cli_overrides["d"] = "cli_d"
-        load_options_file()
+    cli_state.g["options_file"] = str(options_file)
+    cli_overrides["d"] = "cli_d"
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["a"] == "default_a"  # only default
-        assert ctx["b"] == "config_b"   # config overrode default
-        assert ctx["c"] == "opts_c"     # options file overrode config
-        assert ctx["d"] == "cli_d"      # CLI overrode options file
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["a"] == "default_a"  # only default
+    assert ctx["b"] == "config_b"   # config overrode default
+    assert ctx["c"] == "opts_c"     # options file overrode config
+    assert ctx["d"] == "cli_d"      # CLI overrode options file
 
 
-def test_options_file_relative_path(tmp_path):
+def test_options_file_relative_path(tmp_path, monkeypatch):
     """Options file path can be relative (resolved against execroot)."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "default", "short": None, "long": None}
@@ -858,24 +494,20 @@ def test_options_file_relative_path(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('{"options": {"key": "from_opts"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        # Use relative path
-        cli_state.g["options_file"] = "opts.json"
-        load_options_file()
+    # Use relative path
+    cli_state.g["options_file"] = "opts.json"
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["key"] == "from_opts"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["key"] == "from_opts"
 
 
-def test_options_file_expanduser(tmp_path):
+def test_options_file_expanduser(tmp_path, monkeypatch):
     """Options file path expands ~ to home directory."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "default", "short": None, "long": None}
@@ -885,9 +517,8 @@ def test_options_file_expanduser(tmp_path):
     options_file = home / ".test_lionscliapp_opts.json"
     options_file.write_text('{"options": {"key": "from_home"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
+    monkeypatch.chdir(tmp_path)
     try:
-        os.chdir(tmp_path)
         resolve_execroot()
         load_config()
 
@@ -898,33 +529,28 @@ def test_options_file_expanduser(tmp_path):
 
         assert ctx["key"] == "from_home"
     finally:
-        os.chdir(original_cwd)
         # Clean up
         if options_file.exists():
             options_file.unlink()
 
 
-def test_options_file_not_found_raises(tmp_path):
+def test_options_file_not_found_raises(tmp_path, monkeypatch):
     """Missing options file raises FileNotFoundError."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "default", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = "nonexistent.json"
+    cli_state.g["options_file"] = "nonexistent.json"
 
-        with pytest.raises(FileNotFoundError):
-            load_options_file()
+    with pytest.raises(FileNotFoundError):
+        load_options_file()
 
-    finally:
-        os.chdir(original_cwd)
 
 
-def test_options_file_invalid_json_raises(tmp_path):
+def test_options_file_invalid_json_raises(tmp_path, monkeypatch):
     """Invalid JSON in options file raises JSONDecodeError."""
     import json
 
@@ -934,21 +560,17 @@ def test_options_file_invalid_json_raises(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text("{ invalid json }", encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
+    cli_state.g["options_file"] = str(options_file)
 
-        with pytest.raises(json.JSONDecodeError):
-            load_options_file()
-    finally:
-        os.chdir(original_cwd)
+    with pytest.raises(json.JSONDecodeError):
+        load_options_file()
 
 
-def test_options_file_non_dict_raises(tmp_path):
+def test_options_file_non_dict_raises(tmp_path, monkeypatch):
     """Options file that is not a JSON object raises RuntimeError."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "default", "short": None, "long": None}
@@ -956,21 +578,17 @@ def test_options_file_non_dict_raises(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('["a", "list"]', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
-        
-        with pytest.raises(RuntimeError, match="must contain a JSON object"):
-            load_options_file()
-    finally:
-        os.chdir(original_cwd)
+    cli_state.g["options_file"] = str(options_file)
+
+    with pytest.raises(RuntimeError, match="must contain a JSON object"):
+        load_options_file()
 
 
-def test_options_file_ignores_undeclared_keys(tmp_path):
+def test_options_file_ignores_undeclared_keys(tmp_path, monkeypatch):
     """Options file keys not in application.options are ignored."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["declared"] = {"default": "default", "short": None, "long": None}
@@ -978,46 +596,38 @@ def test_options_file_ignores_undeclared_keys(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('{"options": {"declared": "opts_value", "undeclared": "ignored"}}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
-        load_options_file()
+    cli_state.g["options_file"] = str(options_file)
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["declared"] == "opts_value"
-        assert "undeclared" not in ctx
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["declared"] == "opts_value"
+    assert "undeclared" not in ctx
 
 
-def test_options_file_none_is_noop(tmp_path):
+def test_options_file_none_is_noop(tmp_path, monkeypatch):
     """No options file (None) does not affect ctx."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "default", "short": None, "long": None}
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        # Explicitly set to None (already the default, but be explicit)
-        cli_state.g["options_file"] = None
-        load_options_file()
+    # Explicitly set to None (already the default, but be explicit)
+    cli_state.g["options_file"] = None
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        assert ctx["key"] == "default"
-    finally:
-        os.chdir(original_cwd)
+    assert ctx["key"] == "default"
 
 
-def test_options_file_missing_options_key(tmp_path):
+def test_options_file_missing_options_key(tmp_path, monkeypatch):
     """Options file without 'options' key is valid (no overrides applied)."""
     application["names"]["project_dir"] = ".myproject"
     application["options"]["key"] = {"default": "default", "short": None, "long": None}
@@ -1025,18 +635,14 @@ def test_options_file_missing_options_key(tmp_path):
     options_file = tmp_path / "opts.json"
     options_file.write_text('{"meta": "data"}', encoding="utf-8")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        resolve_execroot()
-        load_config()
+    monkeypatch.chdir(tmp_path)
+    resolve_execroot()
+    load_config()
 
-        cli_state.g["options_file"] = str(options_file)
-        load_options_file()
+    cli_state.g["options_file"] = str(options_file)
+    load_options_file()
 
-        build_ctx()
+    build_ctx()
 
-        # No options key, so default remains
-        assert ctx["key"] == "default"
-    finally:
-        os.chdir(original_cwd)
+    # No options key, so default remains
+    assert ctx["key"] == "default"
@@ -1,5 +1,6 @@
 """Tests for lionscliapp.declarations module."""
 
+import sys
 import pytest
 import lionscliapp as app
 from lionscliapp import application as appmodel
@@ -104,6 +105,24 @@ def test_declare_cmd_accepts_empty_string_for_no_command():
     assert appmodel.application["commands"][""]["fn"] is default_fn
 
 
+def test_declare_cmds_binds_each_command():
+    """declare_cmds() creates or binds an entry per command."""
+    def run_fn():
+        pass
+
+    def build_fn():
+        pass
+
+    declarations.describe_cmd("build", "Build the thing")
+    declarations.declare_cmds({"run": run_fn, "build": build_fn})
+
+    commands = appmodel.application["commands"]
+    assert commands["run"]["fn"] is run_fn
+    assert commands["run"]["flags"] == declarations.DEFAULT_COMMAND_FLAGS
+    assert commands["build"]["fn"] is build_fn
+    assert commands["build"]["short"] == "Build the thing"
+
+
 # --- describe_cmd tests ---
 
 def test_describe_cmd_creates_entry_with_required_keys():
@@ -175,6 +194,20 @@ def test_declare_key_creates_option_entry():
     assert "long" in appmodel.application["options"]["execpath.output"]
 
 
+def test_declare_key_and_cmd_intern_names():
+    """Declared option keys and command names are stored interned."""
+    key = "".join(["execpath.", "output"])
+    name = "".join(["bu", "ild"])
+
+    declarations.declare_key(key, "/tmp/out")
+    declarations.declare_cmd(name, lambda: None)
+
+    [stored_key] = appmodel.application["options"]
+    [stored_name] = appmodel.application["commands"]
+    assert stored_key is sys.intern("execpath.output")
+    assert stored_name is sys.intern("build")
+
+
 def test_declare_key_overwrites_default():
     """declare_key() overwrites previously declared default."""
     declarations.declare_key("execpath.output", "/old")
@@ -288,6 +321,14 @@ def test_declare_cmd_raises_when_not_declaring_phase():
         declarations.declare_cmd("test", lambda: None)
 
 
+def test_declare_cmds_raises_when_not_declaring_phase():
+    """declare_cmds() raises when phase is not 'declaring'."""
+    runtime_state._state["phase"] = "running"
+
+    with pytest.raises(RuntimeError, match="not permitted"):
+        declarations.declare_cmds({"test": lambda: None})
+
+
 def test_describe_cmd_raises_when_not_declaring_phase():
     """describe_cmd() raises when phase is not 'declaring'."""
     runtime_state._state["phase"] = "running"
@@ -192,6 +192,15 @@ def test_dispatch_fallback_hides_empty_string_command(capsys):
     # The "" command shouldn't appear in listing even if it existed
 
 
+def test_dispatch_fallback_without_stdout(monkeypatch):
+    """No-command fallback does not fail when sys.stdout is None (pythonw)."""
+    declarations.declare_app("mytool", "1.0")
+    monkeypatch.setattr(sys, "stdout", None)
+    cli_state.g["command"] = None
+
+    assert dispatch_command() is None
+
+
 # --- Error cases ---
 
 def test_dispatch_unknown_command_raises():
@@ -305,3 +314,82 @@ def test_main_no_command_shows_help(tmp_path, monkeypatch, capsys):
     assert "myapp" in captured.out
     assert "My application" in captured.out
     assert "run" in captured.out
+
+
+def test_main_no_command_help_skips_project_setup(tmp_path, monkeypatch, capsys):
+    """Fallback help does not create the project dir or read config."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["myapp"])
+
+    project_dir = tmp_path / ".myapp"
+
+    def my_cmd():
+        pass
+
+    declarations.declare_app("myapp", "1.0")
+    declarations.declare_projectdir(".myapp")
+    declarations.declare_cmd("run", my_cmd)
+
+    app.main()
+
+    assert "run" in capsys.readouterr().out
+    assert not project_dir.exists()
+
+
+def test_main_no_command_help_still_checks_options(tmp_path, monkeypatch, capsys):
+    """A bare invocation with a bad --options-file still fails startup."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["myapp", "--options-file", "missing.json"])
+
+    def my_cmd():
+        pass
+
+    declarations.declare_app("myapp", "1.0")
+    declarations.declare_projectdir(".myapp")
+    declarations.declare_cmd("run", my_cmd)
+
+    with pytest.raises(SystemExit) as exc_info:
+        app.main()
+
+    assert exc_info.value.code == 1
+    assert "Options file not found" in capsys.readouterr().err
+
+
+def test_main_no_command_help_rejects_disallowed_execroot(tmp_path, monkeypatch):
+    """A bare invocation with a disallowed --execroot still fails startup."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["myapp", "--execroot", str(tmp_path)])
+
+    def my_cmd():
+        pass
+
+    declarations.declare_app("myapp", "1.0")
+    declarations.declare_projectdir(".myapp")
+    declarations.declare_cmd("run", my_cmd)
+    declarations.set_flag("allow_execroot_override", False)
+
+    with pytest.raises(SystemExit) as exc_info:
+        app.main()
+
+    assert exc_info.value.code == 1
+
+
+def test_main_no_command_with_default_handler_builds_ctx(tmp_path, monkeypatch):
+    """A declared "" command still gets the full startup, including ctx."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["myapp"])
+
+    seen = []
+
+    def default_cmd():
+        seen.append(app.ctx["greeting"])
+
+    declarations.declare_app("myapp", "1.0")
+    declarations.declare_projectdir(".myapp")
+    declarations.declare_key("greeting", "hello")
+    declarations.declare_cmd("", default_cmd)
+
+    app.main()
+
+    assert seen == ["hello"]
+    assert (tmp_path / ".myapp").is_dir()
@@ -278,6 +278,24 @@ def test_startup_error_is_exported():
     assert app.StartupError is StartupError
 
 
+def test_star_import_exports_public_names():
+    """from lionscliapp import * binds the lazily resolved public API."""
+    namespace = {}
+    exec("from lionscliapp import *", namespace)
+
+    assert namespace["main"] is app.main
+    assert namespace["declare_app"] is app.declare_app
+    assert namespace["ctx"] is app.ctx
+    assert namespace["reset"] is app.reset
+
+
+def test_submodules_are_package_attributes():
+    """Framework submodules are reachable as attributes of the package."""
+    for name in ["declarations", "entrypoint", "json_io", "paths",
+                 "resolve_execroot", "cli_parsing"]:
+        assert getattr(app, name).__name__ == "lionscliapp." + name
+
+
 # --- ensure_commands_bound tests ---
 
 def test_ensure_commands_bound_passes_with_all_bound():
@@ -59,7 +59,7 @@ def test_resolve_execroot_raises_if_called_twice():
         resolve_execroot()
 
 
-def test_resolve_execroot_searches_upwards_when_enabled(tmp_path):
+def test_resolve_execroot_searches_upwards_when_enabled(tmp_path, monkeypatch):
     """resolve_execroot() searches parent directories when flag is enabled."""
     # Create nested structure: tmp_path/.myproject/  (project dir exists here)
     #                          tmp_path/subdir/deeper/  (cwd will be here)
@@ -75,18 +75,13 @@ def test_resolve_execroot_searches_upwards_when_enabled(tmp_path):
     deeper.mkdir(parents=True)
 
     # Change to the deeper directory
-    import os
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(deeper)
-        resolve_execroot()
-        # Should find project dir at tmp_path, not at deeper
-        assert get_execroot() == tmp_path
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(deeper)
+    resolve_execroot()
+    # Should find project dir at tmp_path, not at deeper
+    assert get_execroot() == tmp_path
 
 
-def test_resolve_execroot_uses_cwd_when_upward_search_finds_nothing(tmp_path):
+def test_resolve_execroot_uses_cwd_when_upward_search_finds_nothing(tmp_path, monkeypatch):
     """resolve_execroot() uses cwd when upward search finds no project dir."""
     project_dir = ".nonexistent"
     application["names"]["project_dir"] = project_dir
@@ -96,15 +91,10 @@ def test_resolve_execroot_uses_cwd_when_upward_search_finds_nothing(tmp_path):
     workdir = tmp_path / "workdir"
     workdir.mkdir()
 
-    import os
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(workdir)
-        resolve_execroot()
-        # Should fall back to cwd since nothing found
-        assert get_execroot() == workdir
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(workdir)
+    resolve_execroot()
+    # Should fall back to cwd since nothing found
+    assert get_execroot() == workdir
 
 
 def test_resolve_execroot_cli_override_bypasses_upward_search():
@@ -119,7 +109,7 @@ def test_resolve_execroot_cli_override_bypasses_upward_search():
     assert get_execroot() == override_path
 
 
-def test_resolve_execroot_no_search_when_flag_disabled(tmp_path):
+def test_resolve_execroot_no_search_when_flag_disabled(tmp_path, monkeypatch):
     """resolve_execroot() does not search upwards when flag is false."""
     project_dir = ".myproject"
     application["names"]["project_dir"] = project_dir
@@ -132,12 +122,23 @@ def test_resolve_execroot_no_search_when_flag_disabled(tmp_path):
     subdir = tmp_path / "subdir"
     subdir.mkdir()
 
-    import os
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(subdir)
-        resolve_execroot()
-        # Should NOT find parent's project dir, should use cwd
-        assert get_execroot() == subdir
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(subdir)
+    resolve_execroot()
+    # Should NOT find parent's project dir, should use cwd
+    assert get_execroot() == subdir
+
+
+def test_resolve_execroot_upward_search_finds_project_dir_in_cwd(tmp_path, monkeypatch):
+    """Upward search stops at cwd when the project dir is already there."""
+    project_dir = ".myproject"
+    application["names"]["project_dir"] = project_dir
+    application["flags"]["search_upwards_for_project_dir"] = True
+
+    # Project dirs at both levels; the nearer one wins
+    (tmp_path / project_dir).mkdir()
+    subdir = tmp_path / "subdir"
+    (subdir / project_dir).mkdir(parents=True)
+
+    monkeypatch.chdir(subdir)
+    resolve_execroot()
+    assert get_execroot() == subdir